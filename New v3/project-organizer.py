@@ -1,12 +1,171 @@
+import codecs
+import copy
+import errno
+import mmap
 import os
+import re
 import shutil
+import sys
 import json
 import logging
-from typing import Dict, List, Any
+from functools import lru_cache
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Keyword tables, each ordered by precedence: the first entry found in a file wins
+CATEGORY_KEYWORDS = (
+    ('security', frozenset(('SecurityManager', 'Authentication', 'Authorization'))),
+    ('content', frozenset(('ContentManager', 'MediaHandler', 'CategoryManager'))),
+    ('template', frozenset(('TemplateEngine', 'CacheManager'))),
+    ('infrastructure', frozenset(('Database', 'Cache', 'Logger')))
+)
+PRIORITY_KEYWORDS = (
+    ('high', frozenset(('CRITICAL', 'HIGH_PRIORITY'))),
+    ('medium', frozenset(('IMPORTANT', 'MEDIUM_PRIORITY')))
+)
+STATUS_KEYWORDS = (
+    ('needs_update', frozenset(('NEEDS_UPDATE',))),
+    ('usable', frozenset(('USABLE',))),
+    ('needs_merge', frozenset(('NEEDS_MERGE',)))
+)
+UPDATE_KEYWORDS = frozenset(('TODO', 'FIXME', 'NEEDS_UPDATE'))
+
+# Report groups that are always present, even when no file falls into them
+PRIORITY_GROUPS = ('high', 'medium', 'low')
+STATUS_GROUPS = ('needs_update', 'usable', 'needs_merge')
+
+# Every label a scan can produce, interned so all stored results share one object per label
+_INTERN = {
+    label: sys.intern(label)
+    for label in [label for label, _ in CATEGORY_KEYWORDS + PRIORITY_KEYWORDS + STATUS_KEYWORDS]
+    + ['misc', 'low', 'unknown']
+}
+
+def _build_keyword_actions() -> Dict[str, Tuple[Tuple[int, int], ...]]:
+    """Map every keyword to the (table, rank) slots it sets"""
+    actions: Dict[str, List[Tuple[int, int]]] = {}
+    for kind, table in enumerate((CATEGORY_KEYWORDS, PRIORITY_KEYWORDS, STATUS_KEYWORDS)):
+        for rank, (_, keywords) in enumerate(table):
+            for keyword in keywords:
+                actions.setdefault(keyword, []).append((kind, rank))
+    for keyword in UPDATE_KEYWORDS:
+        actions.setdefault(keyword, []).append((3, 0))
+    return {keyword: tuple(slots) for keyword, slots in actions.items()}
+
+_KEYWORD_ACTIONS = _build_keyword_actions()
+
+# Keyword groups per table in precedence order, the update keywords forming a one-entry table;
+# a table's rank is the first group with any keyword present, as in the original substring tests
+_RANK_TABLES = tuple(
+    tuple(tuple(keywords) for _, keywords in table)
+    for table in (CATEGORY_KEYWORDS, PRIORITY_KEYWORDS, STATUS_KEYWORDS, (('', UPDATE_KEYWORDS),))
+)
+_RANK_TABLES_BYTES = tuple(
+    tuple(tuple(keyword.encode('ascii') for keyword in keywords) for keywords in table)
+    for table in _RANK_TABLES
+)
+
+# A dependency is the last token of a use/require/include statement that starts a line; the
+# pattern captures the statement body and the token is split off in Python, because a lazy
+# prefix followed by a token capture backtracks quadratically on long lines without a ';'
+_DEPENDENCY_RE = re.compile(
+    r'^[ \t]*(?:use|require(?:_once)?|include(?:_once)?)\b([^;\n]*);', re.M
+)
+
+def _build_keyword_automaton() -> Any:
+    """Build an Aho-Corasick automaton over all keywords, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, slots in _KEYWORD_ACTIONS.items():
+        automaton.add_word(keyword, slots)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _rank(find: Callable[[Any], int], tables: Tuple[Tuple[Tuple[Any, ...], ...], ...]) -> List[int]:
+    """Return the best rank per table, testing keyword groups in precedence order with find"""
+    ranks = []
+    for table in tables:
+        for rank, keywords in enumerate(table):
+            if any(find(keyword) >= 0 for keyword in keywords):
+                break
+        else:
+            rank = len(table)
+        ranks.append(rank)
+    return ranks
+
+def _rank_automaton(text: str) -> List[int]:
+    """Return the best rank per table from one pass of the keyword automaton"""
+    ranks = [len(table) for table in _RANK_TABLES]
+    for _, slots in _KEYWORD_AUTOMATON.iter(text):
+        for kind, rank in slots:
+            if rank < ranks[kind]:
+                ranks[kind] = rank
+        # Every classification has hit its top rank; nothing later can change it
+        if not any(ranks):
+            break
+    return ranks
+
+# Directories that hold third-party or generated code are never walked, and files larger than
+# MAX_SCAN_BYTES are recorded with default labels without being opened; both can be overridden
+# through the 'skip_dirs' and 'max_scan_bytes' configuration keys
+SKIP_DIR_NAMES = frozenset(('vendor', 'node_modules', '.git'))
+MAX_SCAN_BYTES = 512 * 1024
+
+# Per-file analysis results are reused across runs while a file's size and mtime are unchanged;
+# bump CACHE_VERSION whenever the keyword tables or scan logic change
+CACHE_FILENAME = '.organizer_cache.json'
+CACHE_VERSION = 1
+
+# Files above this size are memory-mapped and matched as raw bytes; every keyword is ASCII
+MMAP_MIN_BYTES = 64 * 1024
+_DEPENDENCY_RE_BYTES = re.compile(_DEPENDENCY_RE.pattern.encode('ascii'), re.M)
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the escaped lone surrogates written for undecodable file names
+            pass
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # Undecodable file names carry lone surrogates, which orjson rejects
+            pass
+    # ASCII escapes keep lone surrogates representable
+    return json.dumps(obj, separators=(',', ':')).encode('ascii')
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime: float) -> Any:
+    """Parse a JSON file once per (path, mtime); the result is shared and must not be mutated"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+@dataclass(slots=True, frozen=True)
 class FileInfo:
     path: str
     category: str
@@ -17,21 +176,38 @@ class FileInfo:
     needs_update: bool
 
 class ProjectOrganizer:
+    # Trees at least this large are scanned in worker processes instead of threads
+    PROCESS_POOL_MIN_FILES = 1000
+
     def __init__(self, root_path: str, config_path: str):
         self.root_path = root_path
         self.config_path = config_path
-        self.file_registry: Dict[str, FileInfo] = {}
-        
+
+        # Analysis results stored column-wise: row i of every list describes paths[i]
+        self.paths: List[str] = []
+        self.categories: List[str] = []
+        self.priorities: List[str] = []
+        self.statuses: List[str] = []
+        self.deps: List[List[str]] = []
+        self.last_modified: List[datetime] = []
+        self.needs_update: List[bool] = []
+        self._rows: Dict[str, int] = {}
+
+        # Report groups, kept up to date as new rows are registered
+        self._reset_groups()
+
         # Setup logging
         logging.basicConfig(
             filename='project_organization.log',
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
-        self.logger = logging.getLogger(__name__)
 
         # Load configuration
         self.config = self.load_configuration()
+        self.cache_path = os.path.join(root_path, self.config.get('cache_path', CACHE_FILENAME))
+        self.skip_dir_names = frozenset(self.config.get('skip_dirs', SKIP_DIR_NAMES))
+        self.max_scan_bytes = self.config.get('max_scan_bytes', MAX_SCAN_BYTES)
         
         # Define core directories
         self.core_directories = {
@@ -46,161 +222,442 @@ class ProjectOrganizer:
     def load_configuration(self) -> Dict[str, Any]:
         """Load project configuration from JSON file"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            mtime = os.path.getmtime(self.config_path)
+            # Each organizer gets its own copy, nested values included, of the cached parse
+            return copy.deepcopy(_load_json_cached(self.config_path, mtime))
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {e}")
+            logger.error("Failed to load configuration: %s", e)
             raise
 
     def analyze_files(self) -> None:
         """Analyze all project files and categorize them"""
-        for root, _, files in os.walk(self.root_path):
-            for file in files:
-                if file.endswith('.php'):
-                    file_path = os.path.join(root, file)
-                    self.analyze_single_file(file_path)
+        entries = list(self._iter_php(self.root_path))
+        cache = self._load_cache()
 
-    def analyze_single_file(self, file_path: str) -> None:
-        """Analyze a single file and categorize it"""
+        # Oversized files are never opened, and files whose size and mtime match the cache
+        # are not opened again
+        results: Dict[str, FileInfo] = {}
+        pending = []
+        oversized = set()
+        stats: Dict[str, os.stat_result] = {}
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError as e:
+                # The file vanished or became unreadable after the walk; leave it out
+                logger.error("Error reading %s: %s", entry.path, e)
+                continue
+            stats[entry.path] = stat
+            cached = cache.get(entry.path)
+            if stat.st_size > self.max_scan_bytes:
+                results[entry.path] = FileInfo(
+                    path=entry.path,
+                    category=_INTERN['misc'],
+                    priority=_INTERN['low'],
+                    status=_INTERN['unknown'],
+                    dependencies=[],
+                    last_modified=datetime.fromtimestamp(stat.st_mtime),
+                    needs_update=False
+                )
+                oversized.add(entry.path)
+                logger.info("Skipped scanning oversized file %s (%d bytes)", entry.path, stat.st_size)
+            elif cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                category, priority, status, dependencies, needs_update = cached[2:]
+                results[entry.path] = FileInfo(
+                    path=entry.path,
+                    category=category,
+                    priority=priority,
+                    status=status,
+                    dependencies=dependencies,
+                    last_modified=datetime.fromtimestamp(stat.st_mtime),
+                    needs_update=needs_update
+                )
+            else:
+                pending.append(entry)
+
+        if len(pending) >= self.PROCESS_POOL_MIN_FILES:
+            results.update(self._analyze_in_processes(pending))
+        else:
+            results.update(self._analyze_in_threads(pending))
+
+        # Register in walk order so the report does not depend on worker scheduling
+        fresh_cache = {}
+        for entry in entries:
+            file_info = results.get(entry.path)
+            if file_info is None:
+                continue
+            self._register(file_info)
+            # Placeholders are not scan results; caching them would hide the file's real
+            # labels if max_scan_bytes is raised later
+            if entry.path in oversized:
+                continue
+            stat = stats[entry.path]
+            fresh_cache[entry.path] = [
+                stat.st_mtime, stat.st_size, file_info.category, file_info.priority,
+                file_info.status, file_info.dependencies, file_info.needs_update
+            ]
+        self._save_cache(fresh_cache)
+
+    def _analyze_in_threads(self, entries: List[os.DirEntry]) -> Dict[str, FileInfo]:
+        """Read files concurrently, overlapping their I/O latency"""
+        results = {}
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, file_info in executor.map(self._analyze_worker, entries):
+                if file_info is not None:
+                    results[file_path] = file_info
+        return results
+
+    def _analyze_in_processes(self, entries: List[os.DirEntry]) -> Dict[str, FileInfo]:
+        """Scan file contents across CPU cores for large trees"""
+        results = {}
+        paths = []
+        mtimes = []
+        for entry in entries:
+            # Failures are filtered out here so one vanished file cannot abort the dispatch
+            try:
+                mtimes.append(entry.stat().st_mtime)
+            except OSError as e:
+                logger.error("Error analyzing file %s: %s", entry.path, e)
+                continue
+            paths.append(entry.path)
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for file_path, file_info, error in executor.map(_try_scan_php, paths, mtimes, chunksize=64):
+                if file_info is None:
+                    logger.error("Error analyzing file %s: %s", file_path, error)
+                    continue
+                results[file_path] = file_info
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Analyzed file: %s - Category: %s - Priority: %s", file_path, file_info.category, file_info.priority)
+        return results
+
+    def _load_cache(self) -> Dict[str, List[Any]]:
+        """Load per-file analysis results saved by a previous run"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Determine file category and priority
-            category = self.determine_category(content)
-            priority = self.determine_priority(content)
-            status = self.determine_status(content)
-            dependencies = self.find_dependencies(content)
-
-            file_info = FileInfo(
-                path=file_path,
-                category=category,
-                priority=priority,
-                status=status,
-                dependencies=dependencies,
-                last_modified=datetime.fromtimestamp(os.path.getmtime(file_path)),
-                needs_update=self.check_if_needs_update(content)
-            )
-
-            self.file_registry[file_path] = file_info
-            self.logger.info(f"Analyzed file: {file_path} - Category: {category} - Priority: {priority}")
+            with open(self.cache_path, 'rb') as f:
+                cache = _json_loads(f.read())
+            if cache.get('version') == CACHE_VERSION:
+                return cache['files']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Ignoring unreadable analysis cache %s: %s", self.cache_path, e)
+        return {}
 
+    def _save_cache(self, files: Dict[str, List[Any]]) -> None:
+        """Persist this run's analysis results, replacing the previous cache atomically"""
+        try:
+            tmp_path = self.cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps({'version': CACHE_VERSION, 'files': files}))
+            os.replace(tmp_path, self.cache_path)
         except Exception as e:
-            self.logger.error(f"Error analyzing file {file_path}: {e}")
-
-    def determine_category(self, content: str) -> str:
-        """Determine the category of a file based on its content"""
-        categories = {
-            'security': ['SecurityManager', 'Authentication', 'Authorization'],
-            'content': ['ContentManager', 'MediaHandler', 'CategoryManager'],
-            'template': ['TemplateEngine', 'CacheManager'],
-            'infrastructure': ['Database', 'Cache', 'Logger']
-        }
+            logger.error("Error saving analysis cache: %s", e)
 
-        for category, keywords in categories.items():
-            if any(keyword in content for keyword in keywords):
-                return category
-        return 'misc'
-
-    def determine_priority(self, content: str) -> str:
-        """Determine the priority of a file based on its content and dependencies"""
-        if 'CRITICAL' in content or 'HIGH_PRIORITY' in content:
-            return 'high'
-        if 'IMPORTANT' in content or 'MEDIUM_PRIORITY' in content:
-            return 'medium'
-        return 'low'
-
-    def determine_status(self, content: str) -> str:
-        """Determine the status of a file"""
-        if 'NEEDS_UPDATE' in content:
-            return 'needs_update'
-        if 'USABLE' in content:
-            return 'usable'
-        if 'NEEDS_MERGE' in content:
-            return 'needs_merge'
-        return 'unknown'
-
-    def find_dependencies(self, content: str) -> List[str]:
-        """Find dependencies of a file by analyzing use/import statements"""
-        dependencies = []
-        for line in content.split('\n'):
-            if 'use' in line or 'require' in line or 'include' in line:
-                dep = line.split()[-1].strip(';')
-                dependencies.append(dep)
-        return dependencies
-
-    def check_if_needs_update(self, content: str) -> bool:
-        """Check if a file needs updating based on its content and dependencies"""
-        return 'TODO' in content or 'FIXME' in content or 'NEEDS_UPDATE' in content
+    def _iter_php(self, path: str) -> Iterator[os.DirEntry]:
+        """Recursively yield directory entries for PHP files under path"""
+        try:
+            it = os.scandir(path)
+        except OSError as e:
+            # An unreadable or vanished directory is skipped rather than ending the walk
+            logger.error("Error reading directory %s: %s", path, e)
+            return
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.skip_dir_names:
+                        yield from self._iter_php(entry.path)
+                elif entry.is_file() and entry.name.endswith('.php'):
+                    yield entry
+
+    def analyze_single_file(self, entry: os.DirEntry) -> None:
+        """Analyze a single file and categorize it"""
+        _, file_info = self._analyze_worker(entry)
+        if file_info is not None:
+            self._register(file_info)
+
+    def _register(self, file_info: FileInfo) -> None:
+        """Store a scan result as one row of the column lists, replacing any earlier row for its path"""
+        # Labels are re-interned because results from worker processes arrive as fresh copies
+        category = _INTERN.get(file_info.category, file_info.category)
+        priority = _INTERN.get(file_info.priority, file_info.priority)
+        status = _INTERN.get(file_info.status, file_info.status)
+
+        row = self._rows.get(file_info.path)
+        if row is None:
+            if not self._groups_stale:
+                self._category_groups[category].append(file_info.path)
+                self._priority_groups[priority].append(file_info.path)
+                self._status_groups[status].append(file_info.path)
+            self._rows[file_info.path] = len(self.paths)
+            self.paths.append(file_info.path)
+            self.categories.append(category)
+            self.priorities.append(priority)
+            self.statuses.append(status)
+            self.deps.append(file_info.dependencies)
+            self.last_modified.append(file_info.last_modified)
+            self.needs_update.append(file_info.needs_update)
+        else:
+            self.categories[row] = category
+            self.priorities[row] = priority
+            self.statuses[row] = status
+            self.deps[row] = file_info.dependencies
+            self.last_modified[row] = file_info.last_modified
+            self.needs_update[row] = file_info.needs_update
+            # Moving the path between groups in place would cost O(group size) per file;
+            # the groups are rebuilt from the columns once, when next needed
+            self._groups_stale = True
+
+    def _reset_groups(self) -> None:
+        """Start empty report groups; priority and status groups are seeded so empty ones still appear"""
+        self._category_groups: Dict[str, List[str]] = defaultdict(list)
+        self._priority_groups: Dict[str, List[str]] = defaultdict(list, {label: [] for label in PRIORITY_GROUPS})
+        self._status_groups: Dict[str, List[str]] = defaultdict(list, {label: [] for label in STATUS_GROUPS})
+        self._groups_stale = False
+
+    def _analyze_worker(self, entry: os.DirEntry) -> Tuple[str, Optional[FileInfo]]:
+        """Analyze a single file without touching shared state"""
+        file_path = entry.path
+        try:
+            file_info = scan_php(file_path, entry.stat().st_mtime)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Analyzed file: %s - Category: %s - Priority: %s", file_path, file_info.category, file_info.priority)
+            return file_path, file_info
+
+        except Exception as e:
+            logger.error("Error analyzing file %s: %s", file_path, e)
+            return file_path, None
 
     def organize_files(self) -> None:
         """Organize files into appropriate directories"""
-        for file_path, file_info in self.file_registry.items():
-            if file_info.category in self.core_directories:
-                target_dir = os.path.join(self.root_path, self.core_directories[file_info.category])
+        # Create each target directory once up front and keep its path, separator included,
+        # as a prefix so destinations are built by concatenation instead of os.path.join
+        prefixes = {}
+        for category in set(self.categories):
+            if category in self.core_directories:
+                target_dir = os.path.join(self.root_path, self.core_directories[category])
                 self.ensure_directory(target_dir)
-                self.move_file(file_path, target_dir)
+                prefixes[category] = os.path.join(target_dir, '')
+
+        # Files sharing a destination are moved one after another in walk order, so the last
+        # one still wins deterministically; distinct destinations are moved concurrently
+        planned = []
+        moves: Dict[str, List[str]] = defaultdict(list)
+        for file_path, category in zip(self.paths, self.categories):
+            if category in prefixes:
+                destination = prefixes[category] + os.path.basename(file_path)
+                planned.append((file_path, destination))
+                moves[destination].append(file_path)
+
+        for destination, sources in moves.items():
+            if len(sources) > 1:
+                logger.warning("%d files map to %s; keeping %s", len(sources), destination, sources[-1])
+
+        # A destination that is also another move's source (a file already inside a target
+        # directory) must not be overwritten before that file has moved on, so every group in
+        # such a chain runs in one serial batch ordered by those dependencies
+        source_keys = {_path_key(file_path) for file_path, _ in planned}
+        destination_keys = {_path_key(destination) for destination in moves}
+        chained = {
+            destination for destination, sources in moves.items()
+            if _path_key(destination) in source_keys
+            or any(_path_key(source) in destination_keys for source in sources)
+        }
+        batches = [
+            [(source, destination) for source in sources]
+            for destination, sources in moves.items()
+            if destination not in chained
+        ]
+        if chained:
+            batches.append(self._order_chain([move for move in planned if move[1] in chained]))
+
+        # _move logs its own failures, so one bad move does not stop the pool
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(self._move_serially, batches))
+
+    @staticmethod
+    def _order_chain(moves: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Order (source, destination) moves so a file leaves before another move overwrites it"""
+        by_source = {_path_key(source): (source, destination) for source, destination in moves}
+        ordered = []
+        seen = set()
+
+        def visit(move: Tuple[str, str]) -> None:
+            if move in seen:
+                return
+            seen.add(move)
+            # Cycles are cut at the first move seen again; the rest keeps walk order
+            blocker = by_source.get(_path_key(move[1]))
+            if blocker is not None:
+                visit(blocker)
+            ordered.append(move)
+
+        for move in moves:
+            visit(move)
+        return ordered
+
+    def _move_serially(self, moves: List[Tuple[str, str]]) -> None:
+        """Perform (source, destination) moves one at a time, in the order given"""
+        for source, destination in moves:
+            self._move(source, destination)
 
     def ensure_directory(self, directory: str) -> None:
         """Ensure a directory exists, create if it doesn't"""
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-            self.logger.info(f"Created directory: {directory}")
+        os.makedirs(directory, exist_ok=True)
+        logger.info("Ensured directory: %s", directory)
 
     def move_file(self, source: str, target_dir: str) -> None:
         """Move a file to target directory with logging and error handling"""
+        self._move(source, os.path.join(target_dir, os.path.basename(source)))
+
+    def _move(self, source: str, destination: str) -> None:
+        """Move a file to an already resolved destination path"""
         try:
-            filename = os.path.basename(source)
-            destination = os.path.join(target_dir, filename)
-            shutil.move(source, destination)
-            self.logger.info(f"Moved {source} to {destination}")
+            try:
+                # Targets live under root_path, so a single atomic rename almost always works
+                os.replace(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source, destination)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Moved %s to %s", source, destination)
         except Exception as e:
-            self.logger.error(f"Error moving file {source}: {e}")
+            logger.error("Error moving file %s: %s", source, e)
 
     def generate_report(self) -> Dict[str, Any]:
         """Generate a comprehensive report of the project organization"""
-        report = {
+        categories, priorities, status = self._group_paths()
+
+        # Callers own the returned report, so the live groups are copied
+        return {
             'timestamp': datetime.now().isoformat(),
-            'total_files': len(self.file_registry),
-            'categories': {},
-            'priorities': {
-                'high': [],
-                'medium': [],
-                'low': []
-            },
-            'status': {
-                'needs_update': [],
-                'usable': [],
-                'needs_merge': []
-            },
-            'dependencies': {}
+            'total_files': len(self.paths),
+            'categories': {label: list(paths) for label, paths in categories.items()},
+            'priorities': {label: list(paths) for label, paths in priorities.items()},
+            'status': {label: list(paths) for label, paths in status.items()},
+            'dependencies': dict(zip(self.paths, self.deps))
         }
 
-        for file_info in self.file_registry.values():
-            # Update categories
-            if file_info.category not in report['categories']:
-                report['categories'][file_info.category] = []
-            report['categories'][file_info.category].append(file_info.path)
+    def _group_paths(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], Dict[str, List[str]]]:
+        """Return the live report groups, rebuilding them in row order if a row was replaced"""
+        if self._groups_stale:
+            self._reset_groups()
+            for path, category, priority, status in zip(self.paths, self.categories, self.priorities, self.statuses):
+                self._category_groups[category].append(path)
+                self._priority_groups[priority].append(path)
+                self._status_groups[status].append(path)
+        return self._category_groups, self._priority_groups, self._status_groups
 
-            # Update priorities
-            report['priorities'][file_info.priority].append(file_info.path)
+    def write_report(self, output_path: str) -> None:
+        """Stream the project organization report to a JSON file, replacing it atomically"""
+        try:
+            categories, priorities, status = self._group_paths()
 
-            # Update status
-            report['status'][file_info.status].append(file_info.path)
+            # A failure part-way through leaves any previous report intact
+            tmp_path = output_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(b'{\n  "timestamp": ' + _json_dumps(datetime.now().isoformat()))
+                f.write(b',\n  "total_files": ' + _json_dumps(len(self.paths)))
+                self._write_section(f, 'categories', categories.items())
+                self._write_section(f, 'priorities', priorities.items())
+                self._write_section(f, 'status', status.items())
+                self._write_section(f, 'dependencies', zip(self.paths, self.deps))
+                f.write(b'\n}\n')
+            os.replace(tmp_path, output_path)
 
-            # Update dependencies
-            report['dependencies'][file_info.path] = file_info.dependencies
+            logger.info("Saved report to %s", output_path)
+        except Exception as e:
+            logger.error("Error saving report: %s", e)
 
-        return report
+    @staticmethod
+    def _write_section(f: BinaryIO, name: str, items: Iterable[Tuple[str, Any]]) -> None:
+        """Write one top-level report object, serializing a single entry at a time"""
+        f.write(b',\n  ' + _json_dumps(name) + b': {')
+        empty = True
+        for key, value in items:
+            f.write((b'\n    ' if empty else b',\n    ') + _json_dumps(key) + b': ' + _json_dumps(value))
+            empty = False
+        f.write(b'}' if empty else b'\n  }')
 
-    def save_report(self, report: Dict[str, Any], output_path: str) -> None:
-        """Save the generated report to a JSON file"""
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=4)
-            self.logger.info(f"Saved report to {output_path}")
-        except Exception as e:
-            self.logger.error(f"Error saving report: {e}")
+def _path_key(path: str) -> str:
+    """Normalize a path so that spellings of the same file compare equal"""
+    return os.path.normcase(os.path.normpath(path))
+
+def _scan(file_path: str) -> Tuple[str, str, str, List[str], bool]:
+    """Scan a file once, determining category, priority, status, dependencies and update flag"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _scan_mapped(mm)
+        return _scan_text(f.read().decode('utf-8'))
+
+def _scan_text(content: str) -> Tuple[str, str, str, List[str], bool]:
+    """Classify a small file from its whole decoded content"""
+    if _KEYWORD_AUTOMATON is not None:
+        ranks = _rank_automaton(content)
+    else:
+        ranks = _rank(content.find, _RANK_TABLES)
+
+    dependencies = [
+        body.split()[-1]
+        for body in _DEPENDENCY_RE.findall(content)
+        if body.strip()
+    ]
+    return _resolve(ranks, dependencies)
+
+def _scan_mapped(mm: mmap.mmap) -> Tuple[str, str, str, List[str], bool]:
+    """Classify a large file by matching its mapped bytes without decoding them"""
+    _check_utf8(mm)
+    # mmap has no substring 'in', so keywords are located with find
+    ranks = _rank(mm.find, _RANK_TABLES_BYTES)
+
+    # Only the captured dependency names are decoded
+    dependencies = [
+        body.split()[-1].decode('utf-8', 'replace')
+        for body in _DEPENDENCY_RE_BYTES.findall(mm)
+        if body.strip()
+    ]
+    return _resolve(ranks, dependencies)
+
+def _check_utf8(mm: mmap.mmap, chunk_size: int = 1 << 20) -> None:
+    """Raise UnicodeDecodeError for invalid UTF-8, as decoding does for small files"""
+    # Decoded chunks are discarded right away, so memory stays bounded by chunk_size
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for offset in range(0, len(mm), chunk_size):
+        decoder.decode(mm[offset:offset + chunk_size])
+    decoder.decode(b'', final=True)
+
+def _resolve(ranks: List[int], dependencies: List[str]) -> Tuple[str, str, str, List[str], bool]:
+    """Turn the best keyword rank found per table into labels, falling back to the defaults"""
+    category = CATEGORY_KEYWORDS[ranks[0]][0] if ranks[0] < len(CATEGORY_KEYWORDS) else 'misc'
+    priority = PRIORITY_KEYWORDS[ranks[1]][0] if ranks[1] < len(PRIORITY_KEYWORDS) else 'low'
+    status = STATUS_KEYWORDS[ranks[2]][0] if ranks[2] < len(STATUS_KEYWORDS) else 'unknown'
+    return _INTERN[category], _INTERN[priority], _INTERN[status], dependencies, ranks[3] == 0
+
+def scan_php(file_path: str, mtime: Optional[float] = None) -> FileInfo:
+    """Read and classify a single PHP file; safe to run in a worker process"""
+    if mtime is None:
+        mtime = os.path.getmtime(file_path)
+
+    category, priority, status, dependencies, needs_update = _scan(file_path)
+    return FileInfo(
+        path=file_path,
+        category=category,
+        priority=priority,
+        status=status,
+        dependencies=dependencies,
+        last_modified=datetime.fromtimestamp(mtime),
+        needs_update=needs_update
+    )
+
+def _try_scan_php(file_path: str, mtime: float) -> Tuple[str, Optional[FileInfo], Optional[str]]:
+    """Process-pool wrapper that reports failures instead of aborting the map"""
+    try:
+        return file_path, scan_php(file_path, mtime), None
+    except Exception as e:
+        return file_path, None, str(e)
 
 def main():
     # Configuration
@@ -219,15 +676,14 @@ def main():
         organizer.organize_files()
         
         # Generate and save report
-        report = organizer.generate_report()
-        organizer.save_report(report, REPORT_PATH)
+        organizer.write_report(REPORT_PATH)
         
         print("Project organization completed successfully")
         print(f"Check {REPORT_PATH} for detailed report")
         
     except Exception as e:
         print(f"Error during project organization: {e}")
-        logging.error(f"Critical error during project organization: {e}")
+        logger.error("Critical error during project organization: %s", e)
         raise
 
 if __name__ == "__main__":